@@ -1,23 +1,110 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Dict, Hashable, List, Optional, Union
+from typing import Any, Dict, Final, Hashable, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 from yawning_titan.exceptions import (
     ConfigGroupValidationError,
     ConfigItemValidationError,
 )
 from yawning_titan.game_modes.components import _LOGGER
 
-yaml.Dumper.ignore_aliases = lambda *args: True
+SafeDumper.ignore_aliases = lambda *args: True
+
+_defer_validation: ContextVar[bool] = ContextVar("_defer_validation", default=False)
+"""`True` while config elements are being created inside :func: `deferred_validation` in the current thread or task."""
+
+
+@contextmanager
+def deferred_validation():
+    """
+    Skip the validation of :class: `ConfigItem` and :class: `ConfigGroup` elements as they are created.
+
+    Used when composing a tree of config groups so that it is validated once, from its root,
+    rather than every element being validated again by each of its ancestors. The caller must
+    validate the root group once the context has exited.
+    """
+    token = _defer_validation.set(True)
+    try:
+        yield
+    finally:
+        _defer_validation.reset(token)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Get a hashable representation of a value so that values which compare equal also hash equal.
+
+    :param value: Any value held by a config element.
+
+    :return: The value with lists and tuples converted to tuples, dicts and sets to frozensets
+        and any other unhashable object to its repr.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
 
 
 class ConfigBase(ABC):
     """Used to provide helper methods to represent a ConfigGroup object."""
 
+    def __setattr__(self, __name: str, __value: Any) -> None:
+        """
+        Set an attribute of the class, clearing the cached config element names if they may have changed.
+
+        :param __name: the name of the attribute to be set
+        :param __value: the value to set the attribute to
+        """
+        self._clear_config_element_names(__name, __value)
+        super().__setattr__(__name, __value)
+
+    def _clear_config_element_names(self, name: str, value: Any) -> None:
+        """
+        Clear the cached config element names if setting `name` to `value` would change them.
+
+        :param name: the name of the attribute being set
+        :param value: the value the attribute is being set to
+        """
+        names = self.__dict__.get("_config_element_names")
+        if names is not None and (
+            name in names or isinstance(value, _CONFIG_ELEMENT_TYPES)
+        ):
+            del self.__dict__["_config_element_names"]
+
+    def _get_config_element_names(self) -> Tuple[str, ...]:
+        """
+        Get the names of the :class: `ConfigGroup` and :class:`ConfigItem` attributes of the class.
+
+        The names are cached on first access and cleared whenever a config element attribute is set.
+
+        :return: A tuple of attribute names in the order they were set.
+        """
+        names = self.__dict__.get("_config_element_names")
+        if names is None:
+            names = tuple(
+                k
+                for k, v in self.__dict__.items()
+                if isinstance(v, _CONFIG_ELEMENT_TYPES) and not k.startswith("_")
+            )
+            self.__dict__["_config_element_names"] = names
+        return names
+
     def get_config_elements(
         self,
         types: Optional[
@@ -31,19 +118,16 @@ class ConfigBase(ABC):
 
         :return: A dictionary of names to config elements.
         """
+        d = self.__dict__
         if types is not None:
             if isinstance(types, list):
                 types = tuple(types)
             return {
-                k: v
-                for k, v in self.__dict__.items()
-                if isinstance(v, types) and not k.startswith("_")
+                k: d[k]
+                for k in self._get_config_element_names()
+                if isinstance(d[k], types)
             }
-        return {
-            k: v
-            for k, v in self.__dict__.items()
-            if isinstance(v, (ConfigItem, ConfigGroup)) and not k.startswith("_")
-        }
+        return {k: d[k] for k in self._get_config_element_names()}
 
     def get_non_config_elements(self) -> Dict[str, Any]:
         """
@@ -51,36 +135,46 @@ class ConfigBase(ABC):
 
         :return: A dictionary of names to attributes.
         """
+        names = frozenset(self._get_config_element_names())
         return {
             k: v
             for k, v in self.__dict__.items()
-            if k not in self.get_config_elements() and not k.startswith("_")
+            if k not in names and not k.startswith("_")
         }
 
     @property
-    def config_items(self):
+    def config_items(self) -> Dict[str, ConfigItem]:
         """Property to represent the :class: `~yawning_titan.config.core.ConfigItem` children of the group."""
-        return self.get_config_elements(ConfigItem)
+        d = self.__dict__
+        return {
+            k: d[k]
+            for k in self._get_config_element_names()
+            if isinstance(d[k], ConfigItem)
+        }
 
     @property
-    def config_groups(self):
+    def config_groups(self) -> Dict[str, ConfigGroup]:
         """Property to represent the :class: `~yawning_titan.config.core.ConfigGroup` children of the group."""
-        return self.get_config_elements(ConfigGroup)
+        d = self.__dict__
+        return {
+            k: d[k]
+            for k in self._get_config_element_names()
+            if isinstance(d[k], ConfigGroup)
+        }
 
     def stringify(self):
         """Represent the class as a string.
 
         :return: A string.
         """
-        string = f"{self.__class__.__name__}("
         strings = [
             f"{name}={val.stringify()}"
             for name, val in self.get_config_elements().items()
         ]
         strings.extend(
-            [f"{name}={val}" for name, val in self.get_non_config_elements().items()]
+            f"{name}={val}" for name, val in self.get_non_config_elements().items()
         )
-        return string + ", ".join(strings) + ")"
+        return f"{self.__class__.__name__}({', '.join(strings)})"
 
     def __repr__(self) -> str:
         """Return the result of :method: `ConfigBase.stringify`."""
@@ -92,34 +186,47 @@ class ConfigBase(ABC):
 
     def __hash__(self) -> int:
         """Generate a unique hash for the class."""
-        element_hash = [v.stringify() for v in self.get_config_elements().values()]
-        element_hash.extend(
-            [
-                tuple(v) if isinstance(v, (list, dict, set)) else v
-                for v in self.get_non_config_elements().values()
-            ]
-        )
-        element_hash = [v for v in element_hash if isinstance(v, Hashable)]
-        tuple_hash = tuple(element_hash)
-        return hash(tuple_hash)
+        d = self.__dict__
+        element_hash = []
+        for name in self._get_config_element_names():
+            v = d[name]
+            element_hash.append(name)
+            element_hash.append(
+                _freeze(v.value) if isinstance(v, ConfigItem) else hash(v)
+            )
+        element_hash.extend(_freeze(v) for v in self.get_non_config_elements().values())
+        return hash(tuple(element_hash))
 
     def __eq__(self, other) -> bool:
         """Check the equality of any 2 instances of class.
 
+        Config items are compared by value and config groups are compared recursively,
+        returning as soon as a difference is found.
+
         :param other: Another potential instance of the class to be compared against.
 
         :return: A boolean True if the elements holds the same data otherwise False.
         """
-        if isinstance(other, self.__class__):
-            return hash(self) == hash(other)
-        return False
+        if not isinstance(other, self.__class__):
+            return False
+        names = self._get_config_element_names()
+        if names != other._get_config_element_names():
+            return False
+        for name in names:
+            v, other_v = self.__dict__[name], other.__dict__[name]
+            if isinstance(v, ConfigItem):
+                if not isinstance(other_v, ConfigItem) or v.value != other_v.value:
+                    return False
+            elif v != other_v:
+                return False
+        return self.get_non_config_elements() == other.get_non_config_elements()
 
 
 @dataclass()
 class ItemTypeProperties(ABC):
     """An Abstract Base Class that is inherited by config data type properties."""
 
-    _allowed_types: List[type] = None
+    _allowed_types: Tuple[type, ...] = None
     """The allowed data types for the item."""
     allow_null: Optional[bool] = None
     """`True` if the config _value can be left empty, otherwise `False`."""
@@ -184,25 +291,19 @@ class ConfigValidationBase(ConfigBase):
             ]
         ] = None,
     ):
-        if isinstance(fail_reasons, list):
-            self.fail_reasons: List[str] = fail_reasons
+        if fail_reasons is None:
+            fail_reasons = []
         elif isinstance(fail_reasons, str):
-            self.fail_reasons: List[str] = [fail_reasons]
-        else:
-            self.fail_reasons: List[str] = []
+            fail_reasons = [fail_reasons]
+        if fail_exceptions is None:
+            fail_exceptions = []
+        elif not isinstance(fail_exceptions, list):
+            fail_exceptions = [fail_exceptions]
 
-        if isinstance(fail_exceptions, list):
-            self.fail_exceptions: List[
-                Union[ConfigGroupValidationError, ConfigItemValidationError]
-            ] = fail_exceptions
-        elif isinstance(fail_reasons, str):
-            self.fail_exceptions: List[
-                Union[ConfigGroupValidationError, ConfigItemValidationError]
-            ] = [fail_exceptions]
-        else:
-            self.fail_exceptions: List[
-                Union[ConfigGroupValidationError, ConfigItemValidationError]
-            ] = []
+        self.fail_reasons: List[str] = fail_reasons
+        self.fail_exceptions: List[
+            Union[ConfigGroupValidationError, ConfigItemValidationError]
+        ] = fail_exceptions
 
     def add_validation(self, fail_reason: str, exception: ConfigGroupValidationError):
         """
@@ -223,13 +324,11 @@ class ConfigValidationBase(ConfigBase):
 
         :return: A string.
         """
-        string = f"{self.__class__.__name__}("
-
         strings = [f"passed={self.passed}"]
         strings.extend(
-            [f"{name}={val}" for name, val in self.get_non_config_elements().items()]
+            f"{name}={val}" for name, val in self.get_non_config_elements().items()
         )
-        return string + ", ".join(strings) + ")"
+        return f"{self.__class__.__name__}({', '.join(strings)})"
 
     @property
     @abstractmethod
@@ -296,37 +395,53 @@ class ConfigGroupValidation(ConfigValidationBase):
 
         :return: A dict of element names to validation errors or validation dictionaries.
         """
-        if self.passed:
-            d = {}
-        else:
-            d = {"group": self.fail_reasons if self.fail_reasons else "None"}
-        for e, validation in self.element_validation.items():
-            if isinstance(validation, ConfigGroupValidation) and (
-                not validation.group_passed or not validation.passed
-            ):
-                d[e] = validation.to_dict(e, False)
-            elif not validation.passed:
-                d[e] = validation.fail_reasons
-
+        d = self._fail_dict()
+        if d is None:
+            return {element_name: "Passed"} if root else {}
         if root:
-            if not d:
-                return {element_name: "Passed"}
             return {element_name: d}
         return d
 
-    def log(self, element_name: str = "root") -> None:
+    def _fail_dict(self) -> Optional[dict]:
+        """
+        Build the error tree of the group and its descendants in a single pass.
+
+        :return: A dict of element names to validation errors or nested error dicts,
+            or `None` if the group and all of its elements passed.
+        """
+        d = {}
+        for e, validation in self._element_validation.items():
+            if isinstance(validation, ConfigGroupValidation):
+                element_d = validation._fail_dict()
+                if element_d is not None:
+                    d[e] = element_d
+            elif not validation.passed:
+                d[e] = validation.fail_reasons
+
+        if d or not self.group_passed:
+            return {"group": self.fail_reasons if self.fail_reasons else "None", **d}
+        return None
+
+    def log(self, element_name: str = "root") -> str:
         """
         Return the validation results as a formatted string.
 
+        The string is also emitted at debug level on the module logger.
+
         :param element_name: A string name for the element to be represented.
+
+        :return: The formatted validation results.
         """
         string = "\nValidation results\n" "------------------\n"
         d = self.to_dict(element_name)
         if d:
-            string += yaml.dump(d, sort_keys=False, default_flow_style=False)
+            string += yaml.dump(
+                d, Dumper=SafeDumper, sort_keys=False, default_flow_style=False
+            )
         else:
             string += d.get(element_name, "Passed")
-        print(string)
+        _LOGGER.debug(string)
+        return string
 
     @property
     def passed(self) -> bool:
@@ -388,18 +503,22 @@ class ConfigItem:
 
     def __post_init__(self):
         if self.value is None and self.properties.default:
-            self.value = self.properties.default
-        self.validate()
+            self.set_value(self.properties.default)
+        if not _defer_validation.get():
+            self.validate()
 
     def __setattr__(self, __name: str, __value: Any) -> None:
         """
         Set an attribute of the :class: `ConfigItem` if the value is to be set, call the validation method.
 
+        The value set by the dataclass ``__init__`` is not validated here as the
+        properties have not been set yet, it is validated once in ``__post_init__``.
+
         :param __name: the name of the attribute to be set
         :param __value: the value to set the attribute to
         """
         self.__dict__[__name] = __value
-        if __name == "value":
+        if __name == "value" and "validation" in self.__dict__:
             self.validate()
 
     def to_dict(
@@ -464,7 +583,8 @@ class ConfigGroup(ConfigBase, ABC):
         :param doc: The groups doc.
         """
         self.doc: Optional[str] = doc
-        self.validation = self.validate()
+        if not _defer_validation.get():
+            self.validation = self.validate()
 
     def __setattr__(self, __name: str, __value: Any) -> None:
         if (
@@ -474,6 +594,7 @@ class ConfigGroup(ConfigBase, ABC):
         ):
             self.__dict__[__name].value = __value
         else:
+            self._clear_config_element_names(__name, __value)
             self.__dict__[__name] = __value
 
     def validate(
@@ -493,8 +614,10 @@ class ConfigGroup(ConfigBase, ABC):
 
     def validate_elements(self):
         """Call the .validate() method on each of the elements in the group."""
-        for k, element in self.get_config_elements().items():
-            self.validation.add_element_validation(k, element.validate())
+        d = self.__dict__
+        element_validation = self.validation.element_validation
+        for k in self._get_config_element_names():
+            element_validation[k] = d[k].validate()
 
     def to_dict(
         self,
@@ -514,18 +637,16 @@ class ConfigGroup(ConfigBase, ABC):
         if legacy:
             return self.to_legacy_dict()
 
-        attr_dict = {"doc": self.doc} if self.doc is not None else {}
-        # attr_dict = self.get_non_config_elements()
-
         element_dict = {}
+        # config element names never start with "_" so need no filtering here
         for k, e in self.get_config_elements().items():
             d = e.to_dict(values_only=values_only, include_none=include_none)
-            if not k.startswith("_") and (include_none or d is not None):
+            if include_none or d is not None:
                 element_dict[k] = d
 
-        if values_only:
+        if values_only or self.doc is None:
             return element_dict
-        return {**attr_dict, **element_dict}
+        return {"doc": self.doc, **element_dict}
 
     def to_legacy_dict(
         self, flattened_dict: Dict[str, Any] = None
@@ -550,13 +671,14 @@ class ConfigGroup(ConfigBase, ABC):
 
         :param file_path: The path to the .yaml file
         """
+        yaml_str = yaml.dump(
+            self.to_dict(values_only=True),
+            Dumper=SafeDumper,
+            sort_keys=False,
+            default_flow_style=False,
+        )
         with open(file_path, "w") as file:
-            yaml.safe_dump(
-                self.to_dict(values_only=True),
-                file,
-                sort_keys=False,
-                default_flow_style=False,
-            )
+            file.write(yaml_str)
 
     def set_from_dict(
         self,
@@ -594,16 +716,19 @@ class ConfigGroup(ConfigBase, ABC):
                 element: ConfigItem = _legacy_lookup.get(element_name)
                 if isinstance(v, dict):
                     self.set_from_dict(
-                        v, legacy=True, root=False, _legacy_lookup=_legacy_lookup
+                        v, legacy=True, root=False, legacy_lookup=_legacy_lookup
                     )
                 if element is not None:
                     element.set_value(v)
         else:
+            elements = self.__dict__
             for element_name, v in config_dict.items():
-                element = getattr(self, element_name, None)
-                if isinstance(v, dict) and isinstance(element, ConfigGroup):
-                    element.set_from_dict(v, False)
-                elif not isinstance(v, dict) and isinstance(element, ConfigItem):
+                element = elements.get(element_name)
+                is_dict = isinstance(v, dict)
+                if is_dict and isinstance(element, ConfigGroup):
+                    # descendants are validated once by the root group below
+                    element.set_from_dict(v, root=False)
+                elif not is_dict and isinstance(element, ConfigItem):
                     element.set_value(v)
                 else:
                     setattr(self, element_name, v)
@@ -628,3 +753,7 @@ class ConfigGroup(ConfigBase, ABC):
             _LOGGER.critical(msg, exc_info=True)
             raise e
         self.set_from_dict(config_dict, legacy=legacy, infer_legacy=infer_legacy)
+
+
+_CONFIG_ELEMENT_TYPES: Final[Tuple[type, ...]] = (ConfigItem, ConfigGroup)
+"""The types of attribute treated as config elements by :class: `ConfigBase`."""
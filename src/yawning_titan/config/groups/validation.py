@@ -1,6 +1,6 @@
 # -- Validation groups --
 
-from yawning_titan.config.core import ConfigGroup, ConfigGroupValidation, ConfigItem
+from yawning_titan.config.core import ConfigGroup, ConfigGroupValidation
 from yawning_titan.config.item_types.bool_item import BoolItem
 from yawning_titan.config.item_types.float_item import FloatItem
 from yawning_titan.config.item_types.int_item import IntItem
@@ -48,13 +48,9 @@ class AnyUsedGroup(ConfigGroup):
         """Extend the parent validation with additional rules specific to this :class: `~yawning_titan.config.core.ConfigGroup`."""
         super().validate()
         try:
-            values = [e.value for e in self.get_config_elements(ConfigItem).values()]
+            values = [e.value for e in self.config_items.values()]
             values.extend(
-                [
-                    g.use.value
-                    for g in self.get_config_elements(ConfigGroup).values()
-                    if hasattr(g, "use")
-                ]
+                [g.use.value for g in self.config_groups.values() if hasattr(g, "use")]
             )
             if not any(v is True for v in values):
                 msg = f"At least 1 of {', '.join(self.get_config_elements().keys())} should be used"
@@ -14,7 +14,7 @@ class BoolProperties(ItemTypeProperties):
     """The default value"""
 
     def __post_init__(self):
-        self._allowed_types = [bool]
+        self._allowed_types = (bool,)
         super().__post_init__()
 
 
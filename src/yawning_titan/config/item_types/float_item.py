@@ -27,7 +27,7 @@ class FloatProperties(ItemTypeProperties):
     """The default value"""
 
     def __post_init__(self):
-        self._allowed_types = [float, int]
+        self._allowed_types = (float, int)
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Union[float, int]]:
@@ -42,7 +42,7 @@ class IntProperties(ItemTypeProperties):
     """The default value"""
 
     def __post_init__(self):
-        self._allowed_types = [int]
+        self._allowed_types = (int,)
         super().__post_init__()
 
     def to_dict(self) -> Dict[str, Union[int, str]]:
@@ -21,7 +21,7 @@ class StrProperties(ItemTypeProperties):
     """A list of allowed values for the item."""
 
     def __post_init__(self):
-        self._allowed_types = [str]
+        self._allowed_types = (str,)
         super().__post_init__()
 
     def validate(self, val: bool) -> ConfigItemValidation:
@@ -542,14 +542,15 @@ class NetworkInterface:
         # updates the stored adj matrix
         self.adj_matrix = nx.to_numpy_array(self.current_graph)
 
-        if self.game_mode.on_reset.choose_new_entry_nodes.value:
+        on_reset = self.game_mode.on_reset
+        if on_reset.choose_new_entry_nodes.value:
             self.current_graph.reset_random_entry_nodes()
 
         # set high value nodes
-        if self.game_mode.on_reset.choose_new_high_value_nodes.value:
+        if on_reset.choose_new_high_value_nodes.value:
             self.current_graph.reset_random_high_value_nodes()
 
-        if self.game_mode.on_reset.randomise_vulnerabilities.value:
+        if on_reset.randomise_vulnerabilities.value:
             self.current_graph.reset_random_vulnerabilities()
 
     """
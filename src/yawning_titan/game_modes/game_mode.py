@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from yawning_titan.config.core import ConfigGroup
+from yawning_titan.config.core import ConfigGroup, deferred_validation
 from yawning_titan.db.doc_metadata import DocMetadata, DocMetaDataObject
 from yawning_titan.game_modes.components.blue_agent import Blue
 from yawning_titan.game_modes.components.game_rules import GameRules
@@ -30,17 +30,19 @@ class GameMode(ConfigGroup, DocMetaDataObject):
         miscellaneous: Miscellaneous = None,
         _doc_metadata: Optional[DocMetadata] = None,
     ):
-        self.red: Red = red if red else Red()
-        self.blue: Blue = blue if blue else Blue()
-        self.game_rules: GameRules = game_rules if game_rules else GameRules()
-        self.observation_space: ObservationSpace = (
-            observation_space if observation_space else ObservationSpace()
-        )
-        self.on_reset: Reset = on_reset if on_reset else Reset()
-        self.rewards: Rewards = rewards if rewards else Rewards()
-        self.miscellaneous: Miscellaneous = (
-            miscellaneous if miscellaneous else Miscellaneous()
-        )
+        # the whole game mode is validated once by super().__init__
+        with deferred_validation():
+            self.red: Red = red if red else Red()
+            self.blue: Blue = blue if blue else Blue()
+            self.game_rules: GameRules = game_rules if game_rules else GameRules()
+            self.observation_space: ObservationSpace = (
+                observation_space if observation_space else ObservationSpace()
+            )
+            self.on_reset: Reset = on_reset if on_reset else Reset()
+            self.rewards: Rewards = rewards if rewards else Rewards()
+            self.miscellaneous: Miscellaneous = (
+                miscellaneous if miscellaneous else Miscellaneous()
+            )
         self._doc_metadata = _doc_metadata if _doc_metadata else DocMetadata()
         super().__init__(doc)
 
@@ -13,33 +13,53 @@ Networks that can be created are:
 - A custom network using user-input options.
 """
 import math
-import random
-from itertools import combinations, groupby
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Final, Iterator, List, Tuple, Union
 
-import networkx as nx
 import numpy as np
 
 from yawning_titan.networks.network import Network
 from yawning_titan.networks.node import Node
 
+_POSITION_CELL_SIZE: Final[int] = 5
+"""The size of the grid cells that generated node positions are bucketed into, the largest separation value used."""
 
-def check_if_nearby(pos: List[float], full_list: dict, value: int) -> bool:
+
+def _is_nearby(
+    pos: List[int], grid: Dict[Tuple[int, int], List[List[int]]], value: int
+) -> bool:
     """
     Check if a randomly generated point is close to points already generated.
 
+    Only the points in the grid cell of the point and its 8 neighbouring cells can be
+    within the separation value, so only those are checked.
+
     :param pos: The x,y position as a list.
-    :param full_list: The full list of positions.
-    :param value: The separation value.
+    :param grid: The positions already generated keyed by their grid cell.
+    :param value: The separation value, no larger than the grid cell size.
     :return: True if nearby, otherwise False.
     """
-    for i in full_list.values():
-        if i[0] - value <= pos[0] <= i[0] + value:
-            if i[1] - value <= pos[1] <= i[1] + value:
-                return True
+    cell_x = pos[0] // _POSITION_CELL_SIZE
+    cell_y = pos[1] // _POSITION_CELL_SIZE
+    for x in (cell_x - 1, cell_x, cell_x + 1):
+        for y in (cell_y - 1, cell_y, cell_y + 1):
+            for i in grid.get((x, y), ()):
+                if abs(i[0] - pos[0]) <= value and abs(i[1] - pos[1]) <= value:
+                    return True
     return False
 
 
+def _random_positions(batch_size: int, max_pos: int) -> Iterator[List[int]]:
+    """
+    Endlessly yield random x,y positions, drawn from numpy in batches rather than one at a time.
+
+    :param batch_size: The number of positions to draw at once.
+    :param max_pos: The largest value of x or y.
+    :return: An iterator of x,y positions as lists.
+    """
+    while True:
+        yield from np.random.randint(0, max_pos + 1, size=(batch_size, 2)).tolist()
+
+
 def generate_node_positions(matrix: np.array) -> dict:
     """
     Generate a random position for each node and saves it as a dictionary.
@@ -48,30 +68,45 @@ def generate_node_positions(matrix: np.array) -> dict:
 
     :return: A dictionary of node positions.
     """
+    n = len(matrix)
     positions = {}
-    for i in range(0, len(matrix)):
+    grid: Dict[Tuple[int, int], List[List[int]]] = {}
+    candidates = _random_positions(n, n * 4)
+    for i in range(0, n):
         # generates a random x,y position for a node
-        rand_pos = [
-            random.randint(0, len(matrix) * 4),
-            random.randint(0, len(matrix) * 4),
-        ]
+        rand_pos = next(candidates)
         fails = 0
-        value = 5
-        while check_if_nearby(rand_pos, positions, value):
+        value = _POSITION_CELL_SIZE
+        while _is_nearby(rand_pos, grid, value):
             # if that position has already been used then generate a new point
-            rand_pos = [
-                random.randint(0, len(matrix) * 4),
-                random.randint(0, len(matrix) * 4),
-            ]
+            rand_pos = next(candidates)
             fails += 1
-            if fails % 10 == 0:
+            if fails % 10 == 0 and value > 0:
                 value -= 1
-                if value == -1:
-                    value = 0
+        cell = (rand_pos[0] // _POSITION_CELL_SIZE, rand_pos[1] // _POSITION_CELL_SIZE)
+        grid.setdefault(cell, []).append(rand_pos)
         positions[str(i)] = rand_pos
     return positions
 
 
+def _random_symmetric_matrix(size: int, probability: float) -> np.ndarray:
+    """
+    Generate an adjacency matrix where each pair of distinct nodes is connected with a given probability.
+
+    :param size: The number of nodes.
+    :param probability: The chance for any pair of nodes to be connected.
+
+    :return: A symmetric 2D numpy array adjacency matrix with a zero diagonal.
+    """
+    if probability >= 1:
+        # every pair is connected, so there is nothing to draw
+        matrix = np.ones((size, size), dtype=np.uint8)
+        np.fill_diagonal(matrix, 0)
+        return matrix
+    upper = np.triu(np.random.random((size, size)) < probability, k=1)
+    return (upper | upper.T).astype(np.uint8)
+
+
 def get_network_from_matrix_and_positions(
     matrix: np.ndarray,
     positions: Dict[str, List[int]],
@@ -84,21 +119,20 @@ def get_network_from_matrix_and_positions(
     :return: An instance of :class:`~yawning_titan.networks.network.Network`.
     """
     network = Network()
-    edges = []
+    adjacency = np.asarray(matrix) == 1
     # Create all Nodes
     nodes: Dict[Any, Node] = {i: Node(name=str(i)) for i in range(len(matrix))}
-    for y_i, y_node in enumerate(matrix):
+    for y_i in range(len(matrix)):
         # Retrieve the Node and add to the Network
         network.add_node(nodes[y_i])  # Retrieve the positions and set on the Node
-        if str(y_i) in positions.keys():
+        if str(y_i) in positions:
             x, y = positions[str(y_i)]
             nodes[y_i].x_pos = x
-            nodes[y_i].y_pos = y  # If the edge hasn't already been added, add it
-        for x_i, x_node in enumerate(y_node):
-            if x_node == 1:
-                edge = tuple(sorted([y_i, x_i]))
-                if edge not in edges:
-                    network.add_edge(nodes[edge[0]], nodes[edge[1]])
+            nodes[y_i].y_pos = y
+        # Only visit the connected cells, skipping edges already added from an earlier row
+        for x_i in np.flatnonzero(adjacency[y_i]).tolist():
+            if x_i >= y_i or not adjacency[x_i, y_i]:
+                network.add_edge(nodes[y_i], nodes[x_i])
     return network
 
 
@@ -128,7 +162,8 @@ def get_18_node_network_mesh() -> Network:
             [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0],
-        ]
+        ],
+        dtype=np.uint8,
     )
     positions = {
         "0": [1, 7],
@@ -178,7 +213,8 @@ def dcbo_base_network() -> Network:
             [1, 0, 0, 1, 0, 0, 0, 0, 1, 1],
             [1, 1, 1, 0, 0, 0, 1, 1, 0, 1],
             [1, 1, 1, 1, 1, 0, 0, 1, 1, 0],
-        ]
+        ],
+        dtype=np.uint8,
     )
     positions = {
         "0": [3, 8],
@@ -206,12 +242,7 @@ def create_mesh(size: int = 100, connectivity: float = 0.7) -> Network:
 
     :return: An instance of :class:`~yawning_titan.networks.network.Network`.
     """
-    matrix = np.zeros((size, size))
-    for i in range(0, size):
-        for j in range(i + 1, size):
-            if random.randint(0, 99) < connectivity * 100:
-                matrix[i][j] = 1
-                matrix[j][i] = 1
+    matrix = _random_symmetric_matrix(size, connectivity)
 
     positions = generate_node_positions(matrix)
 
@@ -237,20 +268,22 @@ def create_star(
     """
     number_of_nodes = 1 + first_layer_size * group_size
 
-    matrix = np.zeros((number_of_nodes, number_of_nodes))
+    matrix = np.zeros((number_of_nodes, number_of_nodes), dtype=np.uint8)
 
     # creates the groups and connects them
     for i in range(first_layer_size):
-        for j in range(0, group_size):
-            for k in range(j + 1, group_size):
-                if random.randint(0, 99) < group_connectivity * 100:
-                    matrix[j + 1 + i * group_size][k + 1 + i * group_size] = 1
-                    matrix[k + 1 + i * group_size][j + 1 + i * group_size] = 1
+        start = 1 + i * group_size
+        matrix[
+            start : start + group_size, start : start + group_size
+        ] = _random_symmetric_matrix(group_size, group_connectivity)
     # connects the groups to the center node
-    for i in range(0, first_layer_size):
-        connector = random.randint(0, group_size - 1)
-        matrix[0][1 + i * group_size + connector] = 1
-        matrix[1 + i * group_size + connector][0] = 1
+    connectors = (
+        1
+        + np.arange(first_layer_size) * group_size
+        + np.random.randint(0, group_size, size=first_layer_size)
+    )
+    matrix[0, connectors] = 1
+    matrix[connectors, 0] = 1
 
     positions = generate_node_positions(matrix)
 
@@ -276,38 +309,31 @@ def create_p2p(
     :return: An instance of :class:`~yawning_titan.networks.network.Network`.
     """
     # creates the sizes of the groups
-    group1_size = (
-        group_size + random.randint(0, int(group_size / 2)) - int(group_size / 4)
-    )
-    group2_size = (
-        group_size + random.randint(0, int(group_size / 2)) - int(group_size / 4)
-    )
+    group1_size, group2_size = (
+        group_size
+        + np.random.randint(0, int(group_size / 2) + 1, size=2)
+        - int(group_size / 4)
+    ).tolist()
     total_size = group1_size + group2_size
 
-    matrix = np.zeros((total_size, total_size))
+    matrix = np.zeros((total_size, total_size), dtype=np.uint8)
 
     # connections between group 1
-    for i in range(0, group1_size):
-        for j in range(i + 1, group1_size):
-            if random.randint(0, 99) < group_connectivity * 100:
-                matrix[i][j] = 1
-                matrix[j][i] = 1
+    matrix[:group1_size, :group1_size] = _random_symmetric_matrix(
+        group1_size, group_connectivity
+    )
 
     # connections between group 2
-    for i in range(group1_size, total_size):
-        for j in range(i + 1, total_size):
-            if random.randint(0, 99) < group_connectivity * 100:
-                matrix[i][j] = 1
-                matrix[j][i] = 1
+    matrix[group1_size:, group1_size:] = _random_symmetric_matrix(
+        group2_size, group_connectivity
+    )
 
     connections = math.ceil(inter_group_connectivity * total_size)
     # connections between the two groups
-    for i in range(0, connections):
-        g1 = random.randint(0, group1_size - 1)
-        g2 = random.randint(group1_size, total_size - 1)
-
-        matrix[g1][g2] = 1
-        matrix[g2][g1] = 1
+    g1 = np.random.randint(0, group1_size, size=connections)
+    g2 = np.random.randint(group1_size, total_size, size=connections)
+    matrix[g1, g2] = 1
+    matrix[g2, g1] = 1
 
     positions = generate_node_positions(matrix)
 
@@ -324,14 +350,14 @@ def create_ring(break_probability: float = 0.3, ring_size: int = 60) -> Network:
     :param ring_size: The number of nodes in the network.
     :return: An instance of :class:`~yawning_titan.networks.network.Network`.
     """
-    matrix = np.zeros((ring_size, ring_size))
-
-    # runs through the nodes connecting each one to the next
-    for i in range(0, ring_size - 1):
-        if random.randint(1, 99) > break_probability * 100:
-            matrix[i][i + 1] = 1
-            matrix[i + 1][i] = 1
-    if random.randint(1, 99) > break_probability * 100:
+    matrix = np.zeros((ring_size, ring_size), dtype=np.uint8)
+
+    # connects each node to the next, unless the connection is broken
+    keep = (np.random.random(ring_size) >= break_probability).astype(np.uint8)
+    i = np.arange(ring_size - 1)
+    matrix[i, i + 1] = keep[:-1]
+    matrix[i + 1, i] = keep[:-1]
+    if keep[-1]:
         matrix[ring_size - 1][0] = 1
         matrix[0][ring_size - 1] = 1
 
@@ -354,7 +380,7 @@ def custom_network() -> Union[Network, None]:
         print(f"Error in input - '{size}' is not an int")
         return None
 
-    matrix = np.zeros((size, size))
+    matrix = np.zeros((size, size), dtype=np.uint8)
     for i in range(0, size):
         connected_nodes = input(
             "Node: " + str(i) + " is connected to: (separate with comma)"
@@ -389,23 +415,16 @@ def gnp_random_connected_graph(
 
     :return: An instance of :class:`~yawning_titan.networks.network.Network`.
     """
-    edges = combinations(range(n_nodes), 2)
-    graph = nx.Graph()
-    graph.add_nodes_from(range(n_nodes))
     if probability_of_edge <= 0:
         return None
-    if probability_of_edge >= 1:
-        return nx.complete_graph(n_nodes, create_using=graph)
-
-    for _, node_edges in groupby(edges, key=lambda x: x[0]):
-        node_edges = list(node_edges)
-        random_edge = random.choice(node_edges)
-        graph.add_edge(*random_edge)
-        for edge in node_edges:
-            if random.random() < probability_of_edge:
-                graph.add_edge(*edge)
-
-    matrix = nx.to_numpy_array(graph)
+    matrix = _random_symmetric_matrix(n_nodes, probability_of_edge)
+    if probability_of_edge < 1:
+        # connect every node, except the last, to a random node after it
+        sources = np.arange(n_nodes - 1)
+        targets = np.random.randint(sources + 1, n_nodes)
+        matrix[sources, targets] = 1
+        matrix[targets, sources] = 1
+
     positions = generate_node_positions(matrix)
 
     return get_network_from_matrix_and_positions(matrix, positions)
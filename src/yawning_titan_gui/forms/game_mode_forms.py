@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import partial
+from typing import Callable, Dict, List
 
 from django import forms as django_forms
 from django.conf import settings
 from django.forms import widgets
 from django.http import QueryDict
 
-from yawning_titan.config.core import ConfigGroup, ConfigItem
+from yawning_titan.config.core import ConfigGroup
 from yawning_titan.config.item_types.bool_item import BoolItem
 from yawning_titan.config.item_types.float_item import FloatItem
 from yawning_titan.config.item_types.int_item import IntItem
@@ -67,7 +68,7 @@ class ConfigForm(django_forms.Form):
         if self.config_class.validation.passed:
             return True
         else:
-            for k, i in self.config_class.get_config_elements(ConfigItem).items():
+            for k, i in self.config_class.config_items.items():
                 for error in i.validation.fail_reasons:
                     self.add_error(k, error)
 
@@ -87,7 +88,7 @@ class GameModeSection:
         self, section: ConfigGroup = None, form_name: str = None, icon: str = None
     ) -> None:
         self.forms: List[ConfigForm] = []
-        self.form_classes: List[ConfigForm] = []
+        self.form_classes: List[Callable[..., ConfigForm]] = []
         self.icon = icon
         self.config_class = section
         self.name = form_name
@@ -103,7 +104,7 @@ class GameModeSection:
         :param tier: The nested level of the group element which is also used to set the indentation level in the gui
         """
         field_elements = {}
-        for name, e in group.get_config_elements(ConfigItem).items():
+        for name, e in group.config_items.items():
             if isinstance(e, BoolItem):
                 el = django_forms.BooleanField(
                     widget=widgets.CheckboxInput(
@@ -143,19 +144,19 @@ class GameModeSection:
                 )
             field_elements[name] = el
 
-        class ConfigFormSubsection(ConfigForm):
-            def __init__(self, *args, **kwargs):
-                super().__init__(
-                    form_name, tier, group, field_elements, *args, **kwargs
-                )
+        # a partial avoids creating a new ConfigForm subclass, and running the django form
+        # metaclass, for every group of every game mode
+        form_class = partial(ConfigForm, form_name, tier, group, field_elements)
 
-        self.form_classes.append(ConfigFormSubsection)
-        self.forms.append(ConfigFormSubsection(data=group.to_dict(values_only=True)))
+        self.form_classes.append(form_class)
+        self.forms.append(form_class(data=group.to_dict(values_only=True)))
 
-        for name, e in group.get_config_elements(ConfigGroup).items():
+        for name, e in group.config_groups.items():
             self.create_form_from_group(e, form_name=name, tier=tier + 1)
 
-    def get_form_errors(self) -> Dict[str, Dict[str, List[str]]]:
+    def get_form_errors(
+        self, revalidate: bool = True
+    ) -> Dict[str, Dict[str, List[str]]]:
         """
         Create a formatted dictionary of the errors in each of the forms that constitute the game mode section.
 
@@ -165,24 +166,27 @@ class GameModeSection:
         only groups where either group specific errors exist or where an item element within the group has failed
         will be included in the output. This excludes groups that have failed due to a child group failing.
 
+        :param revalidate: Whether to validate the section first. Pass `False` when the section
+            has just been validated, e.g. by :method: `GameModeForm.update_section`.
         :return: a dict.
         """
-        self.config_class.validate()
-        return {
-            i: {
-                "group": form.config_class.validation.fail_reasons,
+        if revalidate:
+            self.config_class.validate()
+        errors = {}
+        for i, form in enumerate(self.forms):
+            validation = form.config_class.validation
+            if validation.group_passed and all(
+                item.validation.passed
+                for item in form.config_class.config_items.values()
+            ):
+                continue
+            errors[i] = {
+                "group": validation.fail_reasons,
                 "items": {
-                    k: v.fail_reasons
-                    for k, v in form.config_class.validation.element_validation.items()
+                    k: v.fail_reasons for k, v in validation.element_validation.items()
                 },
             }
-            for i, form in enumerate(self.forms)
-            if not form.config_class.validation.group_passed
-            or any(
-                not item.validation.passed
-                for item in form.config_class.get_config_elements(ConfigItem).values()
-            )
-        }
+        return errors
 
 
 DocMetaDataForm: django_forms.Form = create_doc_meta_form("game mode")
@@ -280,12 +284,12 @@ class GameModeForm:
     @property
     def first_section(self) -> GameModeSection:
         """Return the first of the game mode sections."""
-        return list(self.sections.values())[0]
+        return next(iter(self.sections.values()))
 
     @property
     def last_section(self) -> GameModeSection:
         """Return the last of the game mode sections."""
-        return list(self.sections.values())[-1]
+        return next(reversed(self.sections.values()))
 
 
 class GameModeFormManager:
@@ -1,5 +1,6 @@
+import copy
 import traceback
-from typing import Dict
+from typing import Dict, Final, List
 
 from django import forms as django_forms
 from django.conf import settings
@@ -14,6 +15,122 @@ from yawning_titan.networks.network import (
 from yawning_titan_gui.forms import RangeInput, create_doc_meta_form
 from yawning_titan_gui.views.utils.helpers import NetworkManager
 
+_NETWORK_TYPES: Final[Dict[str, Dict[str, List[Dict[str, str]]]]] = {
+    "Mesh": {
+        "float": [
+            {
+                "label": "connectivity",
+                "description": "The number of nodes to include in the network",
+            }
+        ],
+        "int": [
+            {
+                "label": "size",
+                "description": "The amount of connections between the nodes. (smaller values mean the connections or more sparse).",
+            }
+        ],
+    },
+    "Star": {
+        "float": [
+            {
+                "label": "star_group_connectivity",
+                "description": "The amount of connections between the groups. (smaller values mean the connections or more sparse).",
+            }
+        ],
+        "int": [
+            {
+                "label": "first_layer_size",
+                "description": "The number of nodes to include in the first layer",
+            },
+            {
+                "label": "star_group_size",
+                "description": "The number of nodes to include in the groups",
+            },
+        ],
+    },
+    "P2P": {
+        "float": [
+            {
+                "label": "inter_group_connectivity",
+                "description": "The amount of connections between the groups. (smaller values mean the connections or more sparse).",
+            },
+            {
+                "label": "P2P_group_connectivity",
+                "description": "The amount of connections within the groups. (smaller values mean the connections or more sparse).",
+            },
+        ],
+        "int": [
+            {
+                "label": "P2P_group_size",
+                "description": "The number of nodes to include in the groups",
+            }
+        ],
+    },
+    "Ring": {
+        "float": [
+            {
+                "label": "break_probability",
+                "description": "The likelihood of a break in the connections of the ring.",
+            }
+        ],
+        "int": [
+            {
+                "label": "ring_size",
+                "description": "The number of nodes to include in the ring",
+            }
+        ],
+    },
+}
+"""The options shown for each type of network that can be created from a template."""
+
+
+def _network_template_fields() -> Dict[str, django_forms.Field]:
+    """
+    Create the fields of the :class:`NetworkTemplateForm`.
+
+    :return: A dict of field names to django form fields.
+    """
+    field_elements = {}
+    field_elements["type"] = django_forms.ChoiceField(
+        widget=django_forms.Select(
+            attrs={"class": "form-control form-select", "type-selector": ""}
+        ),
+        choices=((t, t) for t in _NETWORK_TYPES.keys()),
+        required=True,
+        help_text="The type of network to create",
+        label="Type",
+    )
+
+    for name, items in _NETWORK_TYPES.items():
+        for float_item in items["float"]:
+            field_elements[float_item["label"]] = django_forms.FloatField(
+                widget=RangeInput(
+                    attrs={
+                        "class": "form-control form-range slider-progress " + name,
+                        "step": "0.01",
+                    }
+                ),
+                required=False,
+                help_text=float_item["description"],
+                min_value=0,
+                max_value=1,
+                label=float_item["label"],
+            )
+        for int_item in items["int"]:
+            field_elements[int_item["label"]] = django_forms.IntegerField(
+                widget=widgets.NumberInput(attrs={"class": "form-control " + name}),
+                required=False,
+                help_text=int_item["description"],
+                label=int_item["label"],
+            )
+    return field_elements
+
+
+_NETWORK_TEMPLATE_FIELDS: Final[
+    Dict[str, django_forms.Field]
+] = _network_template_fields()
+"""The fields of the :class:`NetworkTemplateForm`, built once and copied into each form."""
+
 
 class NetworkTemplateForm(django_forms.Form):
     """Form to contain the options for creating a network from a template."""
@@ -24,111 +141,10 @@ class NetworkTemplateForm(django_forms.Form):
         **kwargs,
     ):
         super(NetworkTemplateForm, self).__init__(*args, **kwargs)
-
-        types = {
-            "Mesh": {
-                "float": [
-                    {
-                        "label": "connectivity",
-                        "description": "The number of nodes to include in the network",
-                    }
-                ],
-                "int": [
-                    {
-                        "label": "size",
-                        "description": "The amount of connections between the nodes. (smaller values mean the connections or more sparse).",
-                    }
-                ],
-            },
-            "Star": {
-                "float": [
-                    {
-                        "label": "star_group_connectivity",
-                        "description": "The amount of connections between the groups. (smaller values mean the connections or more sparse).",
-                    }
-                ],
-                "int": [
-                    {
-                        "label": "first_layer_size",
-                        "description": "The number of nodes to include in the first layer",
-                    },
-                    {
-                        "label": "star_group_size",
-                        "description": "The number of nodes to include in the groups",
-                    },
-                ],
-            },
-            "P2P": {
-                "float": [
-                    {
-                        "label": "inter_group_connectivity",
-                        "description": "The amount of connections between the groups. (smaller values mean the connections or more sparse).",
-                    },
-                    {
-                        "label": "P2P_group_connectivity",
-                        "description": "The amount of connections within the groups. (smaller values mean the connections or more sparse).",
-                    },
-                ],
-                "int": [
-                    {
-                        "label": "P2P_group_size",
-                        "description": "The number of nodes to include in the groups",
-                    }
-                ],
-            },
-            "Ring": {
-                "float": [
-                    {
-                        "label": "break_probability",
-                        "description": "The likelihood of a break in the connections of the ring.",
-                    }
-                ],
-                "int": [
-                    {
-                        "label": "ring_size",
-                        "description": "The number of nodes to include in the ring",
-                    }
-                ],
-            },
-        }
-
-        field_elements = {}
-        field_elements["type"] = django_forms.ChoiceField(
-            widget=django_forms.Select(
-                attrs={"class": "form-control form-select", "type-selector": ""}
-            ),
-            choices=((t, t) for t in types.keys()),
-            required=True,
-            help_text="The type of network to create",
-            label="Type",
+        self.fields: Dict[str, django_forms.Field] = copy.deepcopy(
+            _NETWORK_TEMPLATE_FIELDS
         )
 
-        for name, items in types.items():
-            for float_item in items["float"]:
-                field_elements[float_item["label"]] = django_forms.FloatField(
-                    widget=RangeInput(
-                        attrs={
-                            "class": "form-control form-range slider-progress " + name,
-                            "step": "0.01",
-                        }
-                    ),
-                    required=False,
-                    help_text=float_item["description"],
-                    min_value=0,
-                    max_value=1,
-                    label=float_item["label"],
-                )
-            for int_item in items["int"]:
-                field_elements[int_item["label"]] = django_forms.IntegerField(
-                    widget=widgets.NumberInput(attrs={"class": "form-control " + name}),
-                    required=False,
-                    help_text=int_item["description"],
-                    label=int_item["label"],
-                )
-
-        super(NetworkTemplateForm, self).__init__(*args, **kwargs)
-        self.fields: Dict[str, django_forms.Field] = field_elements
-
 
 DocMetaDataForm: django_forms.Form = create_doc_meta_form("network")
 
@@ -28,7 +28,7 @@ function load_template(form_element){
         dataType: "json",
         success: function(response){
             proxy.NETWORK = response.network_json;
-            $("#open-editor").attr("href",EDITOR_URL + response.network_id);
+            $("#open-editor").attr("href",EDITOR_URL + response.network_id + "/");
         }
     });
 }
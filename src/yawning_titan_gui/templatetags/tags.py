@@ -1,9 +1,12 @@
 import json
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 from django import template
+from django.dispatch import receiver
 from django.forms import Field
-from django.urls import reverse
+from django.test.signals import setting_changed
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.utils.safestring import mark_safe
 
 register = template.Library()
@@ -81,11 +84,36 @@ def get_url(url_name: str):
     :return: The full url string as defined in `urls.py`
     """
     try:
-        return reverse(url_name)
+        return _cached_reverse(url_name, get_urlconf(), get_script_prefix())
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=128)
+def _cached_reverse(url_name: str, urlconf: Optional[str], script_prefix: str) -> str:
+    """
+    Reverse a url name once per urlconf and script prefix, as the toolbar filters the same names on every page render.
+
+    Failed lookups raise and so are not cached.
+
+    :param url_name: The name of the url string as defined in `urls.py`.
+    :param urlconf: The urlconf active for the current request, `None` for the ROOT_URLCONF.
+    :param script_prefix: The prefix the url is reversed under; only used as part of the cache key.
+
+    :return: The full url string.
+    """
+    # script_prefix is deliberately unused: reverse() reads the active prefix itself,
+    # the argument only keeps urls reversed under different prefixes apart in the cache
+    return reverse(url_name, urlconf=urlconf)
+
+
+@receiver(setting_changed)
+def _clear_cached_reverse(*, setting: str, **kwargs):
+    """Clear the cached urls when the ROOT_URLCONF setting changes."""
+    if setting == "ROOT_URLCONF":
+        _cached_reverse.cache_clear()
+
+
 @register.filter
 def url_trim(url: str, n: int):
     """Trim url to n parameters.
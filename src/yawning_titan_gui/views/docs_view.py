@@ -2,6 +2,7 @@ from django.http import HttpRequest
 from django.shortcuts import render
 from django.urls import reverse
 from django.views import View
+from django.views.decorators.http import require_safe
 
 from yawning_titan_gui.views.utils.helpers import get_toolbar
 
@@ -21,7 +22,11 @@ class DocsView(View):
             the html page. A `request` object will always be delivered when a page
             object is accessed.
         """
-        doc_url = reverse(f"docs_{section}") if section else reverse("docs index")
+        doc_url = (
+            reverse("docs section", kwargs={"section": section})
+            if section
+            else reverse("docs index")
+        )
         return render(
             request,
             "docs.html",
@@ -39,3 +44,14 @@ class DocsView(View):
             object is accessed.
         """
         return render(request, "docs.html", {"toolbar": get_toolbar("Documentation")})
+
+
+@require_safe
+def docs_section(request: HttpRequest, section: str):
+    """
+    Render a single page of the built sphinx documentation.
+
+    :param request: A Django `request` object.
+    :param section: The name of the docs section, as returned by `get_docs_sections`.
+    """
+    return render(request, f"docs/source/{section}.html")
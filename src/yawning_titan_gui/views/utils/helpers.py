@@ -5,8 +5,9 @@ import os
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from django.urls import reverse
 
@@ -311,20 +312,23 @@ def uniquify(path: Path) -> Path:
     return path
 
 
-def get_docs_sections():
-    """Return names of each section of the sphinx documentation."""
+@lru_cache(maxsize=1)
+def get_docs_sections() -> Tuple[str, ...]:
+    """
+    Return names of each section of the sphinx documentation.
+
+    The built docs do not change while the server is running so the directories are only scanned once.
+    """
     docs_dir = DOCS_ROOT / "source"
     docs_sections = []
     if docs_dir.exists():
-        sections = [p.stem for p in docs_dir.iterdir() if p.suffix == ".html"]
-        docs_sections = docs_sections + sections
+        docs_sections.extend(p.stem for p in docs_dir.iterdir() if p.suffix == ".html")
     docs_dir = docs_dir / "_autosummary"
     if docs_dir.exists():
-        sections = [
+        docs_sections.extend(
             f"_autosummary/{p.stem}" for p in docs_dir.iterdir() if p.suffix == ".html"
-        ]
-        docs_sections = docs_sections + sections
-    return docs_sections
+        )
+    return tuple(docs_sections)
 
 
 def get_url(url_name: str, *args, **kwargs):
@@ -159,7 +159,9 @@ def update_game_mode(request: HttpRequest) -> JsonResponse:
                     {"valid": game_mode_form.game_mode.validation.passed}
                 )  # whether the complete game mode is valid
             else:
+                # the whole game mode was validated by update_section
                 return JsonResponse(
-                    {"errors": json.dumps(section.get_form_errors())}, status=400
+                    {"errors": json.dumps(section.get_form_errors(revalidate=False))},
+                    status=400,
                 )
     return JsonResponse({"message": "Invalid operation"})
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/4.1/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
+import os
 from pathlib import Path
 
 from yawning_titan import IMAGES_DIR, VIDEOS_DIR
@@ -20,12 +21,17 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 # See https://docs.djangoproject.com/en/4.1/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = "django-insecure-cu!)4gec_vj=vhj&jba(b$vd6#$i#v^tr%z%#4idf9c17a#7g9"
+SECRET_KEY = os.environ.get(
+    "DJANGO_SECRET_KEY",
+    "django-insecure-cu!)4gec_vj=vhj&jba(b$vd6#$i#v^tr%z%#4idf9c17a#7g9",
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = False
+DEBUG = os.environ.get("DJANGO_DEBUG", "False").lower() in ("1", "true", "yes")
+
+GUI_ROOT = BASE_DIR / "yawning_titan_gui"
 
-DOCS_ROOT = BASE_DIR / "yawning_titan_gui" / "static" / "docs"
+DOCS_ROOT = GUI_ROOT / "static" / "docs"
 
 # Application definition
 
@@ -49,7 +55,11 @@ MIDDLEWARE = [
 
 # Allows the GUI to be used across the local network, not
 # just on the local machine
-ALLOWED_HOSTS = ["*"]
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "*").split(",")
+    if host.strip()
+]
 CORS_ORIGIN_ALLOW_ALL = True
 
 ROOT_URLCONF = "yawning_titan_server.urls"
@@ -57,7 +67,7 @@ ROOT_URLCONF = "yawning_titan_server.urls"
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [BASE_DIR / "yawning_titan_gui/templates", DOCS_ROOT.parent, DOCS_ROOT],
+        "DIRS": [GUI_ROOT / "templates", DOCS_ROOT.parent, DOCS_ROOT],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -105,7 +115,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = "en-us"
 
-TIME_ZONE = "Europe/London"
+TIME_ZONE = os.environ.get("DJANGO_TIME_ZONE", "Europe/London")
 
 USE_I18N = True
 
@@ -118,7 +128,7 @@ USE_TZ = True
 STATIC_URL = "_static/"
 
 STATICFILES_DIRS = (
-    BASE_DIR / "yawning_titan_gui" / "static",
+    GUI_ROOT / "static",
     DOCS_ROOT / "_static",
     DOCS_ROOT / "_images",
     IMAGES_DIR,
@@ -1,8 +1,11 @@
+import re
+
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from django.urls import path
+from django.urls import include, path, register_converter
+from django.urls.converters import StringConverter
 from django.views.generic import TemplateView
 
-from yawning_titan_gui.views.docs_view import DocsView
+from yawning_titan_gui.views.docs_view import DocsView, docs_section
 from yawning_titan_gui.views.game_mode_config_view import GameModeConfigView
 from yawning_titan_gui.views.game_modes_view import GameModesView
 from yawning_titan_gui.views.home_view import HomeView
@@ -15,62 +18,109 @@ from yawning_titan_gui.views.utils.helpers import get_docs_sections
 from yawning_titan_gui.views.utils.update_network_layout import update_network_layout
 from yawning_titan_gui.views.utils.utils import db_manager, get_output, update_game_mode
 
+_DOCS_SECTIONS = get_docs_sections()
+
+
+class DocsSectionConverter(StringConverter):
+    """
+    Match only the names of the built docs sections.
+
+    Longer names are tried first so a name that is a prefix of another does not cause backtracking.
+    """
+
+    regex = (
+        "|".join(
+            re.escape(name) for name in sorted(_DOCS_SECTIONS, key=len, reverse=True)
+        )
+        or "(?!)"
+    )
+
+
+register_converter(DocsSectionConverter, "docs_section")
+
+# views that are routed from more than one url share a single view callable
+_docs_view = DocsView.as_view()
+_game_mode_config_view = GameModeConfigView.as_view()
+_network_creator_view = NetworkCreator.as_view()
+_network_editor_view = NetworkEditor.as_view()
+
+# The resolver tries these in order, so keep the most requested routes first: the run page
+# polls for output and the config editors post every change, while the docs are rarely visited.
 urlpatterns = [
+    path("output/", get_output, name="stderr"),
+    path("update_game_mode/", update_game_mode, name="update config"),
+    path("update_network_layout/", update_network_layout, name="update network layout"),
     path("", HomeView.as_view(), name="Home"),
-    path("docs/", DocsView.as_view(), name="docs"),
     path("run/", RunView.as_view(), name="Run session"),
-    path("docs/", DocsView.as_view(), name="Documentation"),
     path("jupyter/", JupyterView.as_view(), name="Jupyter Notebooks"),
-    path("docs/<str:section>/", DocsView.as_view(), name="Documentation"),
     path("game_modes/", GameModesView.as_view(), name="Manage game modes"),
     path("networks/", NetworksView.as_view(), name="Manage networks"),
-    path("network_creator", NetworkCreator.as_view(), name="network creator"),
     path(
-        "network_creator/<str:network_id>/",
-        NetworkCreator.as_view(),
-        name="network creator",
+        "network_creator/",
+        include(
+            [
+                path("", _network_creator_view, name="network creator"),
+                path(
+                    "<str:network_id>/",
+                    _network_creator_view,
+                    name="network creator",
+                ),
+            ]
+        ),
     ),
     path(
         "game_mode_config/",
-        GameModeConfigView.as_view(),
-        name="game mode config",
-    ),
-    path(
-        "game_mode_config/<str:game_mode_id>/",
-        GameModeConfigView.as_view(),
-        name="game mode config",
+        include(
+            [
+                path("", _game_mode_config_view, name="game mode config"),
+                path(
+                    "<str:game_mode_id>/",
+                    _game_mode_config_view,
+                    name="game mode config",
+                ),
+                path(
+                    "<str:game_mode_id>/<str:section_name>/",
+                    _game_mode_config_view,
+                    name="game mode config",
+                ),
+            ]
+        ),
     ),
     path(
-        "game_mode_config/<str:game_mode_id>/<str:section_name>/",
-        GameModeConfigView.as_view(),
-        name="game mode config",
-    ),
-    path("network_editor/", NetworkEditor.as_view(), name="network editor"),
-    path("update_network_layout/", update_network_layout, name="update network layout"),
-    path(
-        "network_editor/<str:network_id>",
-        NetworkEditor.as_view(),
-        name="network editor",
+        "network_editor/",
+        include(
+            [
+                path("", _network_editor_view, name="network editor"),
+                path(
+                    "<str:network_id>/",
+                    _network_editor_view,
+                    name="network editor",
+                ),
+            ]
+        ),
     ),
     path("manage_db/", db_manager, name="db manager"),
-    path("update_game_mode/", update_game_mode, name="update config"),
-    path("output/", get_output, name="stderr"),
     path(
-        "docs/index.html",
-        TemplateView.as_view(template_name="docs/index.html"),
-        name="docs index",
+        "docs/",
+        include(
+            [
+                path("", _docs_view, name="Documentation"),
+                path("<docs_section:section>/", _docs_view, name="Documentation"),
+                path(
+                    "index.html",
+                    TemplateView.as_view(template_name="docs/index.html"),
+                    name="docs index",
+                ),
+                path(
+                    "source/<docs_section:section>.html",
+                    docs_section,
+                    name="docs section",
+                ),
+            ]
+        ),
     ),
 ]
 
-urlpatterns += [
-    path(
-        f"docs/source/{name}.html",
-        TemplateView.as_view(template_name=f"docs/source/{name}.html"),
-        name=f"docs_{name}",
-    )
-    for name in get_docs_sections()
-]
-
 urlpatterns += staticfiles_urlpatterns()
 urlpatterns += staticfiles_urlpatterns("docs/_images")
 urlpatterns += staticfiles_urlpatterns("docs/_modules")
@@ -1,7 +1,4 @@
-import os
 from pathlib import Path
 from typing import Final
 
-TEST_PACKAGE_DATA_PATH: Final[Path] = Path(
-    os.path.join(Path(__file__).parent.resolve(), "_package_data")
-)
+TEST_PACKAGE_DATA_PATH: Final[Path] = Path(__file__).parent.resolve() / "_package_data"
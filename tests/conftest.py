@@ -1,10 +1,20 @@
+from __future__ import annotations
+
+import copy
 from contextlib import contextmanager
-from typing import Dict, Final, List, Optional, Type
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Final, List, Optional, Type
 from unittest.mock import patch
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from tests import TEST_PACKAGE_DATA_PATH
 from tests.game_mode_db_patch import game_mode_db_init_patch
 from tests.network_db_patch import network_db_init_patch
@@ -16,21 +26,40 @@ from yawning_titan.config.item_types.int_item import IntItem
 from yawning_titan.config.item_types.str_item import StrItem
 from yawning_titan.db.doc_metadata import DocMetadata, DocMetadataSchema
 from yawning_titan.db.yawning_titan_db import YawningTitanDB
-from yawning_titan.envs.generic.core.action_loops import ActionLoop
 from yawning_titan.exceptions import ConfigGroupValidationError
 from yawning_titan.game_modes.game_mode import GameMode
 from yawning_titan.game_modes.game_mode_db import GameModeDB
 from yawning_titan.networks.network import Network
 from yawning_titan.networks.network_db import NetworkDB
 from yawning_titan.networks.node import Node
-from yawning_titan.yawning_titan_run import YawningTitanRun
-from yawning_titan_gui.views.utils.helpers import GameModeManager, NetworkManager
+
+if TYPE_CHECKING:
+    # Imported lazily in the fixtures below as they pull in stable_baselines3/torch
+    from yawning_titan.yawning_titan_run import YawningTitanRun
+    from yawning_titan_gui.views.utils.helpers import GameModeManager, NetworkManager
 
 TOLERANCE: Final[float] = 0.1
 N_TIME_STEPS: Final[int] = 1000
 N_TIME_STEPS_LONG: Final[int] = 10000
 
 
+def pytest_addoption(parser: pytest.Parser):
+    """Add the `--runslow` option used to opt in to the tests marked as slow."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="Run the slow tests."
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]):
+    """Skip the tests marked as slow unless `--runslow` is passed."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="Slow test, pass --runslow to run it.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @contextmanager
 def not_raises(expected_exception: Type[Exception]):
     """
@@ -77,6 +106,8 @@ def game_mode_db() -> GameModeDB:
 @pytest.fixture(scope="session")
 def game_mode_manager() -> GameModeManager:
     """A patched GameModeManager that uses tests/_package_data/game_modes.json."""
+    from yawning_titan_gui.views.utils.helpers import GameModeManager
+
     with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
         GameModeManager.db = GameModeDB()
         return GameModeManager
@@ -85,6 +116,8 @@ def game_mode_manager() -> GameModeManager:
 @pytest.fixture(scope="session")
 def network_manager() -> NetworkManager:
     """A patched NetworkManager that uses tests/_package_data/networks.json."""
+    from yawning_titan_gui.views.utils.helpers import NetworkManager
+
     with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
         NetworkManager.db = NetworkDB()
         return NetworkManager
@@ -111,7 +144,7 @@ def default_network(network_db) -> Network:
     return network
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_networks(network_manager: NetworkManager) -> List[str]:
     """Create a number of temporary networks as copies of an existing network.
 
@@ -185,22 +218,36 @@ def corporate_network() -> Network:
     return network
 
 
+@lru_cache(maxsize=None)
+def _load_yaml(filepath: Path) -> Dict:
+    """
+    Load a yaml file once per unique path.
+
+    Callers must deep copy the returned dict before mutating it as it is shared.
+
+    :param filepath: The path to the yaml file.
+    :returns: The parsed yaml file as a dict.
+    """
+    with open(filepath, "r") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
 @pytest.fixture()
 def legacy_default_game_mode_dict() -> Dict:
     """
     The legacy default game mode yaml file.
 
-    :returns: The path to the legacy_default_game_mode.yaml as an instance of
-        pathlib.Path.
+    :returns: A copy of the parsed legacy_default_game_mode.yaml as a dict.
     """
-    filepath = TEST_PACKAGE_DATA_PATH / "legacy_default_game_mode.yaml"
-    with open(filepath, "r") as file:
-        return yaml.safe_load(file)
+    return copy.deepcopy(
+        _load_yaml(TEST_PACKAGE_DATA_PATH / "legacy_default_game_mode.yaml")
+    )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def create_yawning_titan_run(network_db: NetworkDB, game_mode_db: GameModeDB):
     """Create an initialised and setup YawningTitanRun."""
+    from yawning_titan.yawning_titan_run import YawningTitanRun
 
     def _create_yawning_titan_run(
         game_mode_name: str,
@@ -229,21 +276,16 @@ def create_yawning_titan_run(network_db: NetworkDB, game_mode_db: GameModeDB):
     return _create_yawning_titan_run
 
 
-@pytest.fixture
-def basic_2_agent_loop(create_yawning_titan_run):
+@pytest.fixture(scope="session")
+def basic_2_agent_loop():
     """Return a basic 2-agent `ActionLoop`."""
+    from yawning_titan.envs.generic.core.action_loops import ActionLoop
 
     def _basic_2_agent_loop(
-        yt_run: YawningTitanRun = None,
+        yt_run: YawningTitanRun,
         num_episodes=1,
     ) -> ActionLoop:
         """Use parameterized settings to return a configured ActionLoop."""
-        if not yt_run:
-            yt_run = create_yawning_titan_run(
-                game_mode_name="Default Game Mode",
-                network_name="Default 18-node network",
-            )
-
         return ActionLoop(yt_run.env, yt_run.agent, episode_count=num_episodes)
 
     return _basic_2_agent_loop
@@ -12,6 +12,7 @@ from yawning_titan.yawning_titan_run import YawningTitanRun
 
 
 @pytest.mark.integration_test()
+@pytest.mark.slow
 @pytest.mark.parametrize(
     ("episodes", "use_custom_settings"),
     [
@@ -35,10 +36,13 @@ def test_repeatable_episodic_output_set_random_seed(
         network=default_network,
         game_mode=game_mode,
         collect_additional_per_ts_data=True,
+        auto=False,
         total_timesteps=1000,
         eval_freq=1000,
         deterministic=True,
     )
+    # Only the action loop plumbing is under test, so skip training the agent
+    yt_run.setup()
     action_loop: ActionLoop = basic_2_agent_loop(
         yt_run=yt_run,
         num_episodes=episodes,
@@ -49,6 +53,7 @@ def test_repeatable_episodic_output_set_random_seed(
 
 
 @pytest.mark.integration_test
+@pytest.mark.slow
 def test_setting_high_value_node_with_random_seeded_randomisation(
     basic_2_agent_loop,
     create_yawning_titan_run,
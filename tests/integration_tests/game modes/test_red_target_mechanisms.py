@@ -9,6 +9,7 @@ from yawning_titan.networks.node import Node
 
 
 @pytest.mark.integration_test
+@pytest.mark.slow
 def test_target_specific_node(
     basic_2_agent_loop,
     create_yawning_titan_run,
@@ -51,6 +52,7 @@ def test_target_specific_node(
 
 
 @pytest.mark.integration_test
+@pytest.mark.slow
 def test_target_node_capture_ends_game(
     basic_2_agent_loop,
     create_yawning_titan_run,
@@ -72,6 +74,7 @@ def test_target_node_capture_ends_game(
 
 
 @pytest.mark.integration_test
+@pytest.mark.slow
 def test_target_node_capture_doesnt_end_game(
     basic_2_agent_loop,
     create_yawning_titan_run,
@@ -1,5 +1,4 @@
 """Test the main :class: `yawning_titan.networks.network_db.NetworkDB`."""
-import copy
 import os
 from unittest.mock import patch
 
@@ -12,62 +11,60 @@ from yawning_titan.exceptions import YawningTitanDBError
 from yawning_titan.networks.network_db import NetworkDB, NetworkSchema
 
 
-@pytest.mark.integration_test
-def test_db_file_exists():
-    """Test the creation of the network db."""
+@pytest.fixture(scope="module")
+def patched_network_db() -> NetworkDB:
+    """A NetworkDB on a temporary db file, built once and shared by the tests in this module."""
     with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
         db = NetworkDB()
-        assert os.path.isfile(db._db._path)
-        db._db.close_and_delete_temp_db()
+    db.rebuild_db()
+    yield db
+    db._db.close_and_delete_temp_db()
 
 
 @pytest.mark.integration_test
-def test_delete_default_network_delete_fails():
-    """Test attempted deletion of locked network fails."""
-    with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
-        db = NetworkDB()
-        db.rebuild_db()
-        config = db.search(DocMetadataSchema.LOCKED == True)[0]
-        with pytest.raises(YawningTitanDBError):
-            db.remove(config)
+def test_db_file_exists(patched_network_db: NetworkDB):
+    """Test the creation of the network db."""
+    assert os.path.isfile(patched_network_db._db._path)
 
-        db._db.close_and_delete_temp_db()
+
+@pytest.mark.integration_test
+def test_delete_default_network_delete_fails(patched_network_db: NetworkDB):
+    """Test attempted deletion of locked network fails."""
+    config = patched_network_db.search(DocMetadataSchema.LOCKED == True)[0]
+    with pytest.raises(YawningTitanDBError):
+        patched_network_db.remove(config)
 
 
 @pytest.mark.integration_test
-def test_reset_default_networks():
+def test_reset_default_networks(patched_network_db: NetworkDB):
     """Test resetting network to default removes modifications."""
-    with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
-        db = NetworkDB()
-        db.rebuild_db()
-        networks_copy = copy.deepcopy(db.all())
+    db = patched_network_db
+    # db.all() builds new Network instances from the stored docs, so no deepcopy is needed
+    networks_copy = db.all()
 
-        network_copy = networks_copy[0]
+    network_copy = networks_copy[0]
 
-        # Update the object locally
-        network_copy.set_random_entry_nodes = False
+    # Update the object locally
+    network_copy.set_random_entry_nodes = False
 
-        # Hack an update to the locked network in the db
-        db._db.db.update(
-            network_copy.to_dict(json_serializable=True),
-            DocMetadataSchema.UUID == network_copy.doc_metadata.uuid,
-        )
+    # Hack an update to the locked network in the db
+    db._db.db.update(
+        network_copy.to_dict(json_serializable=True),
+        DocMetadataSchema.UUID == network_copy.doc_metadata.uuid,
+    )
 
-        # Perform the default network reset
-        db.reset_default_networks_in_db()
+    # Perform the default network reset
+    db.reset_default_networks_in_db()
 
-        assert db.all() == networks_copy
+    assert db.all() == networks_copy
 
-        db._db.close_and_delete_temp_db()
+    # Restore the shared db for the other tests in this module
+    db.reset_default_networks_in_db(force=True)
 
 
 @pytest.mark.integration_test
-def test_network_schema():
+def test_network_schema(patched_network_db: NetworkDB):
     """Test querying the network DB using NetworkSchema."""
-    with patch.object(YawningTitanDB, "__init__", yawning_titan_db_init_patch):
-        db = NetworkDB()
-        db.rebuild_db()
-        results = db.search(NetworkSchema.SET_RANDOM_ENTRY_NODES == True)
-        assert len(results) == 2
-        assert results[0].doc_metadata.uuid == "b3cd9dfd-b178-415d-93f0-c9e279b3c511"
-        db._db.close_and_delete_temp_db()
+    results = patched_network_db.search(NetworkSchema.SET_RANDOM_ENTRY_NODES == True)
+    assert len(results) == 2
+    assert results[0].doc_metadata.uuid == "b3cd9dfd-b178-415d-93f0-c9e279b3c511"
@@ -1,9 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
-from yawning_titan.config.core import ConfigGroup, ConfigGroupValidation
+from yawning_titan.config.core import (
+    ConfigGroup,
+    ConfigGroupValidation,
+    deferred_validation,
+)
 from yawning_titan.config.item_types.bool_item import BoolItem
 from yawning_titan.config.item_types.float_item import FloatItem
 from yawning_titan.config.item_types.int_item import IntItem
@@ -100,6 +106,19 @@ def test_set_config_item_to_value(test_group: Group):
     assert test_group.a.value == "test"
 
 
+@pytest.mark.unit_test
+def test_config_elements_reflect_new_elements(test_group: Group):
+    """Test the cached config elements are refreshed when an element is added or replaced."""
+    assert list(test_group.get_config_elements()) == ["a", "b", "c"]
+
+    test_group.d = IntItem(value=1)
+    new_b = IntItem(value=2)
+    test_group.b = new_b
+
+    assert list(test_group.get_config_elements()) == ["a", "b", "c", "d"]
+    assert test_group.get_config_elements(IntItem) == {"b": new_b, "d": test_group.d}
+
+
 @pytest.mark.unit_test
 def test_create_from_legacy(test_group: Group):
     """Test the group can be created using legacy config names."""
@@ -126,6 +145,29 @@ def test_stringify(test_group: Group):
     )
 
 
+@pytest.mark.unit_test
+def test_equality(multi_tier_test_group: GroupTier2):
+    """Test groups are equal when their nested item values match and unequal otherwise."""
+    other = GroupTier2()
+    assert multi_tier_test_group == other
+    assert hash(multi_tier_test_group) == hash(other)
+
+    other.tier_1.float.value = 0.5
+    assert multi_tier_test_group != other
+
+
+@pytest.mark.unit_test
+def test_hash_unhashable_values():
+    """Test groups holding nested list and dict values can be hashed and equal groups hash equally."""
+    group, other = Group(), Group()
+    for g in (group, other):
+        g.c.value = ("a", ["b"])
+        g.extra = {"d": [1, 2]}
+
+    assert group == other
+    assert hash(group) == hash(other)
+
+
 @pytest.mark.unit_test
 def test_repeat_item_validation(test_group: Group):
     """Test validating a group then modifying its items and re-validating."""
@@ -230,3 +272,47 @@ def test_yaml_round_trip(test_group: Group, tmp_path: Path):
     d2 = test_group.to_dict()
 
     assert d1 == d2
+
+
+@pytest.mark.unit_test
+def test_set_nested_from_dict_validates_from_root(multi_tier_test_group: GroupTier2):
+    """Test setting nested groups from a dict validates the whole tree once from the root group."""
+    with patch.object(
+        GroupTier1, "validate", autospec=True, side_effect=GroupTier1.validate
+    ) as mock_validate:
+        multi_tier_test_group.set_from_dict(
+            {"bool": False, "tier_1": {"bool": True, "float": 2.0}}
+        )
+
+    mock_validate.assert_called_once()
+    assert multi_tier_test_group.tier_1.float.value == 2.0
+    assert not multi_tier_test_group.validation.passed
+    assert not multi_tier_test_group.validation.elements_passed
+
+
+@pytest.mark.unit_test
+def test_validation_to_dict(multi_tier_test_group: GroupTier2):
+    """Test the validation error tree only contains the failing branches of a multi tier group."""
+    assert multi_tier_test_group.validate().to_dict() == {"root": "Passed"}
+
+    multi_tier_test_group.tier_1.bool.value = True
+    multi_tier_test_group.tier_1.float.value = 2
+    multi_tier_test_group.int.value = "test"
+
+    assert multi_tier_test_group.validate().to_dict() == {
+        "root": {
+            "group": "None",
+            "int": ["Value test is of type <class 'str'>, should be <class 'int'>."],
+            "tier_1": {"group": ["test error tier 1"]},
+        }
+    }
+
+
+@pytest.mark.unit_test
+def test_deferred_validation_is_thread_local():
+    """Test groups created in another thread are still validated while validation is deferred in this one."""
+    with deferred_validation(), ThreadPoolExecutor(max_workers=1) as executor:
+        group = executor.submit(Group).result()
+
+    assert group.validation.passed
+    assert group.a.validation.passed
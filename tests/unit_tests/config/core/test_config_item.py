@@ -1,10 +1,13 @@
+from unittest.mock import patch
+
 import pytest
 
-from yawning_titan.config.core import ConfigItem
+from yawning_titan.config.core import ConfigItem, ConfigItemValidation
 from yawning_titan.config.item_types.bool_item import BoolItem, BoolProperties
 from yawning_titan.config.item_types.float_item import FloatItem, FloatProperties
 from yawning_titan.config.item_types.int_item import IntItem, IntProperties
 from yawning_titan.config.item_types.str_item import StrItem, StrProperties
+from yawning_titan.exceptions import ConfigItemValidationError
 
 
 @pytest.mark.unit_test
@@ -48,3 +51,27 @@ def test_assign_incorrect_properties(item, properties):
     """Test item types raise an :class: `~yawning_titan.exceptions.TypeError` error when using incorrect property types."""
     with pytest.raises(TypeError):
         item(value=None, properties=properties)
+
+
+@pytest.mark.unit_test
+def test_validation_wraps_single_reason_and_exception():
+    """Test a single fail reason and exception passed to a validation are each wrapped in a list."""
+    e = ConfigItemValidationError("test")
+    validation = ConfigItemValidation(fail_reasons="test", fail_exceptions=e)
+
+    assert validation.fail_reasons == ["test"]
+    assert validation.fail_exceptions == [e]
+    assert ConfigItemValidation().passed
+
+
+@pytest.mark.unit_test
+def test_init_validates_once():
+    """Test the ConfigItem is only validated once when it is created."""
+    properties = StrProperties(default="default")
+    with patch.object(
+        StrProperties, "validate", wraps=properties.validate
+    ) as mock_validate:
+        item = ConfigItem(value=None, properties=properties)
+
+    mock_validate.assert_called_once_with("default")
+    assert item.validation.passed
@@ -10,13 +10,6 @@ from yawning_titan.game_modes.components.blue_agent import (
     MakeNodeSafeGroup,
 )
 
-
-@pytest.fixture
-def default_blue(default_game_mode) -> Blue:
-    """Get blue from default game mode."""
-    return default_game_mode.blue
-
-
 # --- Tier 1 groups ---
 
 
@@ -64,7 +57,9 @@ def test_no_max_number_deceptive_nodes():
 
 @pytest.mark.unit_test
 @pytest.mark.parametrize(
-    ("reconnect_node", "isolate_node"), ((True, False), (False, True))
+    ("reconnect_node", "isolate_node"),
+    ((True, False), (False, True)),
+    ids=["reconnect_only", "isolate_only"],
 )
 def test_reconnect_isolate_config(reconnect_node: bool, isolate_node: bool):
     """Tests use isolate node while reconnect node is False."""
@@ -86,7 +81,9 @@ def test_reconnect_isolate_config(reconnect_node: bool, isolate_node: bool):
 
 @pytest.mark.unit_test
 @pytest.mark.parametrize(
-    ("on_scan_deceptive_node", "on_scan"), ((0.5, 0.6), (0.5, 0.5))
+    ("on_scan_deceptive_node", "on_scan"),
+    ((0.5, 0.6), (0.5, 0.5)),
+    ids=["deceptive_lower", "deceptive_equal"],
 )
 def test_lower_chance_detecting_deceptive_node_intrusion_on_scan_fail(
     on_scan_deceptive_node, on_scan
@@ -169,7 +166,7 @@ def test_not_using_scan_without_assured_immediate_detection():
 
 
 @pytest.mark.unit_test
-def test_default_blue_from_legacy(default_blue: Blue, legacy_default_game_mode_dict):
+def test_default_blue_from_legacy(legacy_default_game_mode_dict):
     """Create a blue agent using the default config file."""
     blue = Blue()
 
@@ -9,3 +9,30 @@ catch the errors raised.
 
 .. todo:: Write full test suite.
 """
+from unittest.mock import patch
+
+import pytest
+
+from yawning_titan.config.core import ConfigGroup, ConfigItem
+from yawning_titan.game_modes.game_mode import GameMode
+
+
+def _count_items(group: ConfigGroup) -> int:
+    """Count the :class: `ConfigItem`'s in a group and all of its descendant groups."""
+    return len(group.config_items) + sum(
+        _count_items(g) for g in group.config_groups.values()
+    )
+
+
+@pytest.mark.unit_test
+def test_game_mode_items_validated_once():
+    """Test each item of a new GameMode is validated exactly once, by the root game mode."""
+    with patch.object(
+        ConfigItem, "validate", autospec=True, side_effect=ConfigItem.validate
+    ) as mock_validate:
+        game_mode = GameMode()
+
+    assert mock_validate.call_count == _count_items(game_mode)
+    # an empty game mode has no max steps so the deferred item validation must be recorded
+    assert not game_mode.game_rules.max_steps.validation.passed
+    assert not game_mode.validation.elements_passed
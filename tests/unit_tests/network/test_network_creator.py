@@ -0,0 +1,81 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from yawning_titan.networks import network_creator
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    ("connectivity", "expected_edges"), ((0, 0), (1, 45)), ids=["none", "full"]
+)
+def test_create_mesh(connectivity: float, expected_edges: int):
+    """Test a mesh network is connected according to its connectivity."""
+    network = network_creator.create_mesh(size=10, connectivity=connectivity)
+
+    assert network.number_of_nodes() == 10
+    assert network.number_of_edges() == expected_edges
+
+
+@pytest.mark.unit_test
+def test_create_star():
+    """Test a star network is made of fully connected groups each joined once to the centre node."""
+    network = network_creator.create_star(
+        first_layer_size=4, group_size=3, group_connectivity=1
+    )
+
+    assert network.number_of_nodes() == 13
+    # 3 edges within each of the 4 groups and 1 edge from each group to the centre
+    assert network.number_of_edges() == 4 * 3 + 4
+    assert network.degree(network.get_node_from_name("0")) == 4
+
+
+@pytest.mark.unit_test
+def test_create_p2p_groups_fully_connected():
+    """Test the two groups of a p2p network are complete when the group connectivity is 1."""
+    network = network_creator.create_p2p(
+        group_size=4, inter_group_connectivity=0, group_connectivity=1
+    )
+
+    group_sizes = [len(c) for c in nx.connected_components(network)]
+
+    assert len(group_sizes) == 2
+    assert network.number_of_edges() == sum(n * (n - 1) // 2 for n in group_sizes)
+
+
+@pytest.mark.unit_test
+def test_generate_node_positions_separated():
+    """Test a position is generated for each node, within bounds and apart from the other positions."""
+    positions = network_creator.generate_node_positions(np.zeros((50, 50)))
+
+    assert list(positions) == [str(i) for i in range(50)]
+    assert all(0 <= v <= 200 for pos in positions.values() for v in pos)
+    assert len({tuple(pos) for pos in positions.values()}) == 50
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    ("break_probability", "expected_edges"), ((0, 10), (1, 0)), ids=["closed", "broken"]
+)
+def test_create_ring(break_probability: float, expected_edges: int):
+    """Test a ring network connects each node to the next unless every connection is broken."""
+    network = network_creator.create_ring(
+        break_probability=break_probability, ring_size=10
+    )
+
+    assert network.number_of_nodes() == 10
+    assert network.number_of_edges() == expected_edges
+    if expected_edges:
+        assert all(d == 2 for _, d in network.degree)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("probability_of_edge", (0.01, 0.5, 1))
+def test_gnp_random_connected_graph(probability_of_edge: float):
+    """Test every node of a random gnp network has at least one connection."""
+    network = network_creator.gnp_random_connected_graph(
+        n_nodes=20, probability_of_edge=probability_of_edge
+    )
+
+    assert network.number_of_nodes() == 20
+    assert all(d > 0 for _, d in network.degree)
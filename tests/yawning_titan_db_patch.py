@@ -1,24 +1,33 @@
 """Provides a patch to the YawningTitanDB."""
+import atexit
+import os
+import shutil
 import tempfile
+from itertools import count
 
 from tinydb import TinyDB
 
 from tests import TEST_PACKAGE_DATA_PATH
 
+_TEMP_DB_DIR = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, _TEMP_DB_DIR, ignore_errors=True)
+_temp_db_counter = count()
+
 
 def yawning_titan_db_init_patch(self, name: str):
     """
     Patch the :func:`yawning_titan.db.yawning_titan_db.YawningTitanDB.__init__`.
 
     So that TinyDB testing can be done in isolation, the main init method is patched so that
-    a temporary .json file used to create the TinyDB db file using :py:func:`tempfile.TemporaryFile`.
+    a temporary .json file, uniquely numbered within a directory created by :py:func:`tempfile.mkdtemp`
+    and removed when the test session exits, is used to create the TinyDB db file.
 
     Self and name params only present so that subclasses of
     :class:`~yawning_titan.db.yawning_titan_db.YawningTitanDB` don't break when instantiating
     the patched class.
     """
     self._name: str = name
-    self._path = tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=True).name
+    self._path = os.path.join(_TEMP_DB_DIR, f"{name}_{next(_temp_db_counter)}.json")
 
     self._db = TinyDB(self._path)
 